@@ -5,6 +5,7 @@ Main CLI interface for the PubMed paper fetcher application.
 """
 
 import logging
+import os
 import sys
 from typing import Optional
 import click
@@ -13,6 +14,9 @@ from .pubmed_client import PubMedClient
 from .paper_analyzer import PaperAnalyzer
 from .csv_exporter import CSVExporter
 
+# Analysis only outweighs process start-up and pickling for large result sets
+PARALLEL_THRESHOLD = 2000
+
 
 def setup_logging(debug: bool = False) -> None:
     """
@@ -37,7 +41,9 @@ def setup_logging(debug: bool = False) -> None:
 @click.option('-d', '--debug', is_flag=True, help='Enable debug logging')
 @click.option('--max-results', default=100, help='Maximum number of results to fetch')
 @click.option('--api-key', help='NCBI API key for higher rate limits')
-def main(query: str, output_file: Optional[str], debug: bool, max_results: int, api_key: Optional[str]) -> None:
+@click.option('--no-cache', is_flag=True, help='Disable the on-disk cache of fetched papers')
+def main(query: str, output_file: Optional[str], debug: bool, max_results: int, api_key: Optional[str],
+         no_cache: bool) -> None:
     """
     Fetch research papers from PubMed and filter by pharmaceutical/biotech company affiliations.
     
@@ -56,57 +62,52 @@ def main(query: str, output_file: Optional[str], debug: bool, max_results: int,
         logger.info(f"Starting PubMed paper search with query: {query}")
         
         # Initialize components
-        client = PubMedClient(api_key=api_key)
         analyzer = PaperAnalyzer()
         exporter = CSVExporter()
         
-        # Search for papers
-        logger.info("Searching PubMed for papers...")
-        pmid_list = client.search_papers(query, max_results=max_results)
-        
-        if not pmid_list:
-            logger.warning("No papers found for the given query")
-            print("No papers found matching your query.")
-            return
-            
-        logger.info(f"Found {len(pmid_list)} papers, fetching details...")
+        cache_dir = None if no_cache else PubMedClient.CACHE_DIR
         
-        # Fetch paper details
-        papers_data = []
-        for i, pmid in enumerate(pmid_list, 1):
-            logger.debug(f"Processing paper {i}/{len(pmid_list)}: PMID {pmid}")
+        with PubMedClient(api_key=api_key, cache_dir=cache_dir) as client:
+            # Search for papers and stream their details, serving cached papers locally
+            logger.info("Searching PubMed for papers...")
+            count, papers = client.search_and_fetch(query, max_results=max_results)
             
-            paper_details = client.fetch_paper_details(pmid)
-            if paper_details:
-                # Analyze paper for company affiliations
-                analyzed_paper = analyzer.analyze_paper(paper_details)
+            if not count:
+                logger.warning("No papers found for the given query")
+                print("No papers found matching your query.")
+                return
                 
-                # Only include papers with company affiliations
-                if analyzed_paper.get('company_affiliations'):
-                    papers_data.append(analyzed_paper)
-                    logger.debug(f"Found company affiliation in PMID {pmid}")
-                    
-        logger.info(f"Found {len(papers_data)} papers with company affiliations")
-        
-        # Validate and clean data
-        cleaned_data = exporter.validate_data(papers_data)
-        
-        if not cleaned_data:
-            logger.warning("No papers with company affiliations found")
-            print("No papers with pharmaceutical/biotech company affiliations found.")
-            return
+            logger.info(f"Found {count} papers, fetching details...")
             
-        # Export results
-        if output_file:
-            success = exporter.export_to_csv(cleaned_data, output_file)
-            if success:
+            # Stream papers through analysis, spread across CPU cores when large
+            workers = (os.cpu_count() or 1) if count >= PARALLEL_THRESHOLD else 1
+            analyzed_papers = analyzer.analyze_iter(papers, workers=workers)
+            
+            # Export results
+            if output_file:
+                exported = exporter.export_stream(analyzed_papers, output_file)
+                if exported is None:
+                    logger.error("Failed to export results to CSV")
+                    sys.exit(1)
+                elif exported == 0:
+                    logger.warning("No papers with company affiliations found")
+                    print("No papers with pharmaceutical/biotech company affiliations found.")
+                    return
+                    
+                logger.info(f"Found {exported} papers with company affiliations")
                 print(f"Results exported to {output_file}")
             else:
-                logger.error("Failed to export results to CSV")
-                sys.exit(1)
-        else:
-            exporter.export_to_console(cleaned_data)
-            
+                # Validate and clean data
+                cleaned_data = exporter.validate_data(list(analyzed_papers))
+                
+                if not cleaned_data:
+                    logger.warning("No papers with company affiliations found")
+                    print("No papers with pharmaceutical/biotech company affiliations found.")
+                    return
+                    
+                logger.info(f"Found {len(cleaned_data)} papers with company affiliations")
+                exporter.export_to_console(cleaned_data)
+                
         logger.info("Processing completed successfully")
         
     except Exception as e:
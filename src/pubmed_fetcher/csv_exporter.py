@@ -5,15 +5,35 @@ Handles CSV output generation and formatting of paper analysis results.
 """
 
 import csv
+import io
 import logging
-from typing import List, Dict, Any, Optional
-import pandas as pd
+from itertools import chain
+from typing import Iterable, Iterator, List, Dict, Any, Optional, Tuple
 
 
 class CSVExporter:
     """Handles CSV export functionality."""
     
-    def __init__(self):
+    FIELDNAMES = [
+        'PubmedID',
+        'Title',
+        'Publication Date',
+        'Non-academic Author(s)',
+        'Company Affiliation(s)',
+        'Corresponding Author Email'
+    ]
+    
+    # Maximum width of truncated columns in console output
+    CONSOLE_WIDTHS = {
+        'Title': 50,
+        'Non-academic Author(s)': 30,
+        'Company Affiliation(s)': 30
+    }
+    
+    # Output buffer size; large enough that most exports flush in a few writes
+    BUFFER_SIZE = 1 << 20
+    
+    def __init__(self) -> None:
         """Initialize the CSV exporter."""
         self.logger = logging.getLogger(__name__)
         
@@ -33,32 +53,11 @@ class CSVExporter:
             return False
             
         try:
-            # Define column headers
-            fieldnames = [
-                'PubmedID',
-                'Title', 
-                'Publication Date',
-                'Non-academic Author(s)',
-                'Company Affiliation(s)',
-                'Corresponding Author Email'
-            ]
-            
             # Write CSV file
-            with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                writer.writeheader()
-                
-                for row in data:
-                    # Map internal field names to CSV column names
-                    csv_row = {
-                        'PubmedID': row.get('pmid', ''),
-                        'Title': row.get('title', ''),
-                        'Publication Date': row.get('publication_date', ''),
-                        'Non-academic Author(s)': row.get('non_academic_authors', ''),
-                        'Company Affiliation(s)': row.get('company_affiliations', ''),
-                        'Corresponding Author Email': row.get('corresponding_author_email', '')
-                    }
-                    writer.writerow(csv_row)
+            with self._open_csv(filename) as csvfile:
+                writer = csv.writer(csvfile)
+                writer.writerow(self.FIELDNAMES)
+                writer.writerows(self._map_row(row) for row in data)
                     
             self.logger.info(f"Successfully exported {len(data)} papers to {filename}")
             return True
@@ -67,6 +66,90 @@ class CSVExporter:
             self.logger.error(f"Error exporting to CSV: {e}")
             return False
             
+    def export_stream(self, rows: Iterable[Dict[str, Any]], filename: str) -> Optional[int]:
+        """
+        Validate and export rows to a CSV file as they arrive.
+        
+        The file is only created once the first valid row is available,
+        so an empty stream leaves no file behind.
+        
+        Args:
+            rows: Iterable of dictionaries containing paper data
+            filename: Output filename
+            
+        Returns:
+            Number of rows written, or None if the file could not be written
+            
+        Errors raised while producing rows propagate to the caller.
+        """
+        cleaned_rows = (cleaned for cleaned in map(self._clean_row, rows) if cleaned)
+        
+        first_row = next(cleaned_rows, None)
+        if first_row is None:
+            self.logger.warning("No data to export")
+            return 0
+            
+        written = 0
+        source_error: Optional[Exception] = None
+        
+        def mapped_rows() -> Iterator[Tuple[Any, ...]]:
+            nonlocal written, source_error
+            try:
+                for row in chain([first_row], cleaned_rows):
+                    written += 1
+                    yield self._map_row(row)
+            except Exception as e:
+                # Remember upstream failures so they are not taken for write errors
+                source_error = e
+                raise
+                
+        try:
+            with self._open_csv(filename) as csvfile:
+                writer = csv.writer(csvfile)
+                writer.writerow(self.FIELDNAMES)
+                writer.writerows(mapped_rows())
+                
+            self.logger.info(f"Successfully exported {written} papers to {filename}")
+            return written
+            
+        except (OSError, csv.Error) as e:
+            if e is source_error:
+                raise
+            self.logger.error(f"Error exporting to CSV: {e}")
+            return None
+            
+    def _open_csv(self, filename: str) -> io.TextIOWrapper:
+        """
+        Open a CSV file for writing behind a large output buffer.
+        
+        Args:
+            filename: Output filename
+            
+        Returns:
+            Text stream suitable for csv.writer
+        """
+        raw = open(filename, 'wb', buffering=self.BUFFER_SIZE)
+        return io.TextIOWrapper(raw, encoding='utf-8', newline='', write_through=False)
+        
+    def _map_row(self, row: Dict[str, Any]) -> Tuple[Any, ...]:
+        """
+        Project internal fields onto a tuple in CSV column order.
+        
+        Args:
+            row: Dictionary containing paper data
+            
+        Returns:
+            Tuple of values matching FIELDNAMES
+        """
+        return (
+            row.get('pmid', ''),
+            row.get('title', ''),
+            row.get('publication_date', ''),
+            row.get('non_academic_authors', ''),
+            row.get('company_affiliations', ''),
+            row.get('corresponding_author_email', '')
+        )
+        
     def export_to_console(self, data: List[Dict[str, Any]]) -> None:
         """
         Print data to console in a formatted table.
@@ -78,25 +161,37 @@ class CSVExporter:
             print("No papers found matching the criteria.")
             return
             
-        # Create DataFrame for nice formatting
-        df_data = []
-        for row in data:
-            df_data.append({
-                'PubmedID': row.get('pmid', ''),
-                'Title': row.get('title', '')[:50] + '...' if len(row.get('title', '')) > 50 else row.get('title', ''),
-                'Publication Date': row.get('publication_date', ''),
-                'Non-academic Author(s)': row.get('non_academic_authors', '')[:30] + '...' if len(row.get('non_academic_authors', '')) > 30 else row.get('non_academic_authors', ''),
-                'Company Affiliation(s)': row.get('company_affiliations', '')[:30] + '...' if len(row.get('company_affiliations', '')) > 30 else row.get('company_affiliations', ''),
-                'Corresponding Author Email': row.get('corresponding_author_email', '')
-            })
-            
-        df = pd.DataFrame(df_data)
+        # Truncate long columns, then pad every column to its widest value
+        limits = [self.CONSOLE_WIDTHS.get(name) for name in self.FIELDNAMES]
+        rows = [
+            [self._truncate(str(value), limit) for value, limit in zip(self._map_row(row), limits)]
+            for row in data
+        ]
+        widths = [max(len(value) for value in column) for column in zip(self.FIELDNAMES, *rows)]
         
         print(f"\nFound {len(data)} papers with pharmaceutical/biotech company affiliations:")
         print("=" * 80)
-        print(df.to_string(index=False))
+        for line in [self.FIELDNAMES] + rows:
+            print('  '.join(value.ljust(width) for value, width in zip(line, widths)).rstrip())
         print("=" * 80)
         
+    @staticmethod
+    def _truncate(value: str, limit: Optional[int]) -> str:
+        """
+        Shorten a value for console display.
+        
+        Args:
+            value: Text to display
+            limit: Maximum number of characters, or None for no limit
+            
+        Returns:
+            The value, cut to the limit with a trailing ellipsis if needed
+        """
+        if limit is None or len(value) <= limit:
+            return value
+            
+        return value[:limit] + '...'
+        
     def validate_data(self, data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
         Validate and clean data before export.
@@ -107,21 +202,30 @@ class CSVExporter:
         Returns:
             Cleaned data list
         """
-        cleaned_data = []
-        
-        for row in data:
-            # Ensure all required fields exist
-            cleaned_row = {
-                'pmid': str(row.get('pmid', '')),
-                'title': str(row.get('title', '')),
-                'publication_date': str(row.get('publication_date', '')),
-                'non_academic_authors': str(row.get('non_academic_authors', '')),
-                'company_affiliations': str(row.get('company_affiliations', '')),
-                'corresponding_author_email': str(row.get('corresponding_author_email', ''))
-            }
-            
-            # Remove any papers without basic information
-            if cleaned_row['pmid'] and cleaned_row['title']:
-                cleaned_data.append(cleaned_row)
-                
-        return cleaned_data 
\ No newline at end of file
+        return [cleaned for cleaned in map(self._clean_row, data) if cleaned]
+        
+    def _clean_row(self, row: Dict[str, Any]) -> Optional[Dict[str, str]]:
+        """
+        Validate and clean a single row.
+        
+        Args:
+            row: Dictionary containing paper data
+            
+        Returns:
+            Cleaned row, or None if it lacks basic information
+        """
+        # Ensure all required fields exist
+        cleaned_row = {
+            'pmid': str(row.get('pmid', '')),
+            'title': str(row.get('title', '')),
+            'publication_date': str(row.get('publication_date', '')),
+            'non_academic_authors': str(row.get('non_academic_authors', '')),
+            'company_affiliations': str(row.get('company_affiliations', '')),
+            'corresponding_author_email': str(row.get('corresponding_author_email', ''))
+        }
+        
+        # Remove any papers without basic information
+        if cleaned_row['pmid'] and cleaned_row['title']:
+            return cleaned_row
+            
+        return None 
\ No newline at end of file
@@ -6,14 +6,23 @@ and non-academic authors.
 """
 
 import re
+import functools
 import logging
-from typing import Dict, List, Any, Tuple, Optional
+import multiprocessing
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
+from typing import Deque, Dict, Iterable, Iterator, List, Any, Tuple, Optional
+import ahocorasick
 
 
 class PaperAnalyzer:
     """Analyzes papers for company affiliations and non-academic authors."""
     
-    def __init__(self):
+    # Number of distinct affiliations whose classification is memoized
+    CLASSIFY_CACHE_SIZE = 4096
+    
+    def __init__(self) -> None:
         """Initialize the paper analyzer."""
         self.logger = logging.getLogger(__name__)
         
@@ -44,6 +53,86 @@ class PaperAnalyzer:
             'university of', 'state university', 'medical university'
         ]
         
+        # Aho-Corasick automatons find every keyword hit in a single pass
+        self._company_ac = self._build_automaton(self.company_keywords, 'company')
+        self._academic_ac = self._build_automaton(self.academic_keywords, 'academic')
+        
+        # Single-word keywords can be checked with one set intersection
+        # against the affiliation's tokens before falling back to a scan
+        self._token_re = re.compile(r'[a-z0-9&]+')
+        self._company_tokens = frozenset(
+            k for k in self.company_keywords if ' ' not in k and '-' not in k
+        )
+        self._academic_tokens = frozenset(
+            k for k in self.academic_keywords if ' ' not in k and '-' not in k
+        )
+        
+        # Additional heuristics for non-academic institutions, combined
+        # into a single alternation so each affiliation is scanned once
+        non_academic_patterns = [
+            r'\b(inc|corp|ltd|llc|company|co\.)\b',
+            r'\b(pharmaceutical|biotech|biotechnology)\b',
+            r'\b(research|development|rd)\s+(center|institute|facility)\b',
+            r'\b(clinical|medical)\s+(trial|research|development)\b'
+        ]
+        self._non_academic_re = re.compile(
+            '|'.join(f'(?:{pattern})' for pattern in non_academic_patterns),
+            re.IGNORECASE
+        )
+        
+        # Patterns that suggest company names
+        company_patterns = [
+            r'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+(Inc|Corp|Ltd|LLC|Company|Co\.)\b',
+            r'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+(Pharmaceuticals|Biotech|Biotechnology)\b',
+            r'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+(Research|Development|R&D)\s+(Center|Institute|Facility)\b'
+        ]
+        self._company_res = [re.compile(pattern, re.IGNORECASE) for pattern in company_patterns]
+        
+        self._install_classify_cache()
+        
+    def _install_classify_cache(self) -> None:
+        """Memoize affiliation classification, since co-authors often share one."""
+        self._classify = functools.lru_cache(maxsize=self.CLASSIFY_CACHE_SIZE)(self._classify_impl)
+        
+    def __getstate__(self) -> Dict[str, Any]:
+        """
+        Prepare the analyzer for pickling, e.g. when sent to worker processes.
+        
+        Returns:
+            Instance state without the memoized classifier, which cannot be pickled
+        """
+        state = self.__dict__.copy()
+        del state['_classify']
+        return state
+        
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """
+        Restore a pickled analyzer with a fresh classification cache.
+        
+        Args:
+            state: Instance state returned by __getstate__
+        """
+        self.__dict__.update(state)
+        self._install_classify_cache()
+        
+    @staticmethod
+    def _build_automaton(keywords: List[str], kind: str) -> ahocorasick.Automaton:
+        """
+        Build a multi-pattern matcher for a keyword list.
+        
+        Args:
+            keywords: Lowercase keywords to match
+            kind: Label stored alongside each keyword
+            
+        Returns:
+            Automaton ready for searching
+        """
+        automaton = ahocorasick.Automaton()
+        for keyword in keywords:
+            automaton.add_word(keyword, (kind, keyword))
+        automaton.make_automaton()
+        return automaton
+        
     def analyze_paper(self, paper_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Analyze a paper to identify company affiliations and non-academic authors.
@@ -58,8 +147,8 @@ class PaperAnalyzer:
             return self._create_empty_result()
             
         authors = paper_data.get('authors', [])
-        non_academic_authors = []
-        company_affiliations = []
+        non_academic_authors: List[str] = []
+        company_affiliations: List[str] = []
         corresponding_author_email = ''
         
         for author in authors:
@@ -67,20 +156,19 @@ class PaperAnalyzer:
             affiliation = author.get('affiliation', '').lower()
             email = author.get('email', '')
             
-            # Check if author is non-academic
-            if self._is_non_academic_author(affiliation):
+            # Check if author is non-academic and for company affiliations
+            is_non_academic, companies = self._classify(affiliation)
+            if is_non_academic:
                 non_academic_authors.append(author_name)
-                
-                # Check for company affiliations
-                companies = self._extract_company_affiliations(affiliation)
                 company_affiliations.extend(companies)
                 
             # Extract corresponding author email
             if email and not corresponding_author_email:
                 corresponding_author_email = email
                 
-        # Remove duplicates
-        company_affiliations = list(set(company_affiliations))
+        # Remove duplicates, keeping first-seen order
+        non_academic_authors = list(dict.fromkeys(non_academic_authors))
+        company_affiliations = list(dict.fromkeys(company_affiliations))
         
         return {
             'pmid': paper_data.get('pmid', ''),
@@ -91,6 +179,81 @@ class PaperAnalyzer:
             'corresponding_author_email': corresponding_author_email
         }
         
+    def analyze_iter(self, papers: Iterable[Dict[str, Any]], workers: int = 1,
+                     chunksize: int = 64) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily analyze papers, keeping only those with company affiliations.
+        
+        Args:
+            papers: Iterable of paper dictionaries
+            workers: Number of worker processes; 1 analyzes in this process
+            chunksize: Number of papers sent to a worker per task
+            
+        Yields:
+            Analysis results for papers with company affiliations
+        """
+        if workers > 1:
+            analyzed_papers = self._analyze_parallel(papers, workers, chunksize)
+        else:
+            analyzed_papers = map(self.analyze_paper, papers)
+            
+        for analyzed_paper in analyzed_papers:
+            if analyzed_paper['company_affiliations']:
+                self.logger.debug(f"Found company affiliation in PMID {analyzed_paper['pmid']}")
+                yield analyzed_paper
+                
+    def _analyze_parallel(self, papers: Iterable[Dict[str, Any]], workers: int,
+                          chunksize: int) -> Iterator[Dict[str, Any]]:
+        """
+        Analyze papers across worker processes, preserving input order.
+        
+        Only 2 x workers chunks are in flight at a time, so papers are
+        pulled from the input as results are consumed rather than all up
+        front. Each worker receives the analyzer once, at start-up.
+        
+        Args:
+            papers: Iterable of paper dictionaries
+            workers: Number of worker processes
+            chunksize: Number of papers per task
+            
+        Yields:
+            Analysis results in input order
+        """
+        papers_iter = iter(papers)
+        chunks = iter(lambda: list(islice(papers_iter, chunksize)), [])
+        pending: Deque[Future] = deque()
+        
+        # The input is usually fed by the fetch worker thread, and forking a
+        # process that has live threads can deadlock, so workers are spawned
+        executor = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'),
+                                       initializer=_init_worker, initargs=(self,))
+        try:
+            for chunk in chunks:
+                pending.append(executor.submit(_analyze_chunk, chunk))
+                if len(pending) >= 2 * workers:
+                    yield from pending.popleft().result()
+                    
+            while pending:
+                yield from pending.popleft().result()
+                
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+            
+    def _classify_impl(self, affiliation_lower: str) -> Tuple[bool, Tuple[str, ...]]:
+        """
+        Classify a lowercased affiliation.
+        
+        Args:
+            affiliation_lower: Lowercased affiliation text
+            
+        Returns:
+            Tuple of (is non-academic, company names found)
+        """
+        if not self._is_non_academic_author(affiliation_lower):
+            return False, ()
+            
+        return True, tuple(self._extract_company_affiliations(affiliation_lower))
+        
     def _is_non_academic_author(self, affiliation: str) -> bool:
         """
         Determine if an author is non-academic based on affiliation.
@@ -105,28 +268,28 @@ class PaperAnalyzer:
             return False
             
         affiliation_lower = affiliation.lower()
+        tokens = set(self._token_re.findall(affiliation_lower))
         
+        # Fast path: whole-word keyword matches
+        if tokens & self._academic_tokens:
+            return False
+            
+        if tokens & self._company_tokens:
+            # Company tokens only count when no academic keyword appears
+            # anywhere in the text, including inside longer words
+            return next(self._academic_ac.iter(affiliation_lower), None) is None
+            
         # Check for academic keywords
-        for academic_keyword in self.academic_keywords:
-            if academic_keyword in affiliation_lower:
-                return False
-                
+        if next(self._academic_ac.iter(affiliation_lower), None) is not None:
+            return False
+            
         # Check for company keywords
-        for company_keyword in self.company_keywords:
-            if company_keyword in affiliation_lower:
-                return True
+        if next(self._company_ac.iter(affiliation_lower), None) is not None:
+            return True
                 
         # Additional heuristics for non-academic institutions
-        non_academic_patterns = [
-            r'\b(inc|corp|ltd|llc|company|co\.)\b',
-            r'\b(pharmaceutical|biotech|biotechnology)\b',
-            r'\b(research|development|rd)\s+(center|institute|facility)\b',
-            r'\b(clinical|medical)\s+(trial|research|development)\b'
-        ]
-        
-        for pattern in non_academic_patterns:
-            if re.search(pattern, affiliation_lower):
-                return True
+        if self._non_academic_re.search(affiliation_lower):
+            return True
                 
         return False
         
@@ -144,22 +307,18 @@ class PaperAnalyzer:
         affiliation_lower = affiliation.lower()
         
         # Check for known company names
-        for company_keyword in self.company_keywords:
-            if company_keyword in affiliation_lower:
-                # Try to extract the full company name
-                company_name = self._extract_company_name(affiliation, company_keyword)
-                if company_name:
-                    companies.append(company_name)
+        matched_keywords = dict.fromkeys(
+            keyword for _, (_, keyword) in self._company_ac.iter(affiliation_lower)
+        )
+        for company_keyword in matched_keywords:
+            # Try to extract the full company name
+            company_name = self._extract_company_name(affiliation, company_keyword)
+            if company_name:
+                companies.append(company_name)
                     
         # Look for patterns that suggest company names
-        company_patterns = [
-            r'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+(Inc|Corp|Ltd|LLC|Company|Co\.)\b',
-            r'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+(Pharmaceuticals|Biotech|Biotechnology)\b',
-            r'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+(Research|Development|R&D)\s+(Center|Institute|Facility)\b'
-        ]
-        
-        for pattern in company_patterns:
-            matches = re.findall(pattern, affiliation, re.IGNORECASE)
+        for pattern in self._company_res:
+            matches = pattern.findall(affiliation)
             for match in matches:
                 if isinstance(match, tuple):
                     company_name = ' '.join(match)
@@ -203,4 +362,20 @@ class PaperAnalyzer:
             'non_academic_authors': '',
             'company_affiliations': '',
             'corresponding_author_email': ''
-        } 
\ No newline at end of file
+        }
+
+
+# Analyzer used by tasks in a worker process, installed by _init_worker
+_worker_analyzer: Optional[PaperAnalyzer] = None
+
+
+def _init_worker(analyzer: PaperAnalyzer) -> None:
+    """Install the analyzer for this worker process."""
+    global _worker_analyzer
+    _worker_analyzer = analyzer
+
+
+def _analyze_chunk(papers: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Analyze a chunk of papers in a worker process."""
+    assert _worker_analyzer is not None
+    return [_worker_analyzer.analyze_paper(paper) for paper in papers]
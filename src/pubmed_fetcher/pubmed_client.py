@@ -5,11 +5,60 @@ Handles all interactions with the PubMed API including searching for papers
 and fetching detailed information about papers and authors.
 """
 
+import asyncio
 import logging
+import os
+import queue
+import re
+import threading
 import time
-from typing import Dict, List, Optional, Any
+from collections import deque
+from io import BytesIO
+from typing import TYPE_CHECKING, Deque, Dict, Iterator, List, Optional, Any, Tuple, cast
+import diskcache
 import requests
-from xml.etree import ElementTree as ET
+from lxml import etree
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    import json as orjson  # type: ignore[no-redef]
+
+if TYPE_CHECKING:
+    import aiohttp
+
+
+class _RateLimiter:
+    """Sliding-window rate limiter for asynchronous API calls."""
+    
+    def __init__(self, max_calls: int, period: float = 1.0):
+        """
+        Initialize the rate limiter.
+        
+        Args:
+            max_calls: Maximum number of calls allowed per period
+            period: Length of the window in seconds
+        """
+        self.max_calls = max_calls
+        self.period = period
+        self._calls: Deque[float] = deque()
+        self._lock = asyncio.Lock()
+        
+    async def acquire(self) -> None:
+        """Wait until the window allows another call, then record it."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                while self._calls and now - self._calls[0] >= self.period:
+                    self._calls.popleft()
+                    
+                if len(self._calls) < self.max_calls:
+                    self._calls.append(now)
+                    return
+                    
+                await asyncio.sleep(self.period - (now - self._calls[0]))
 
 
 class PubMedClient:
@@ -18,53 +67,154 @@ class PubMedClient:
     BASE_URL = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils"
     SEARCH_URL = f"{BASE_URL}/esearch.fcgi"
     FETCH_URL = f"{BASE_URL}/efetch.fcgi"
+    MAX_RETRIES = 5
+    MAX_SEARCH_RESULTS = 10000
+    
+    # PubMed embeds author emails in the affiliation text
+    _EMAIL_RE = re.compile(r'[\w.+\-]+@[\w\-]+\.[\w.\-]+')
+    CACHE_DIR = os.path.expanduser('~/.cache/pubmed_fetcher')
+    CACHE_TTL = 30 * 24 * 60 * 60
     
-    def __init__(self, api_key: Optional[str] = None, delay: float = 0.1):
+    # The fetch worker is a daemon thread, so shutdown does not wait out an
+    # in-flight request and its retries
+    WORKER_JOIN_TIMEOUT = 1.0
+    
+    def __init__(self, api_key: Optional[str] = None, delay: float = 0.1, cache_dir: Optional[str] = None):
         """
         Initialize PubMed client.
         
         Args:
             api_key: NCBI API key for higher rate limits
             delay: Delay between API calls in seconds
+            cache_dir: Directory for the on-disk cache of fetched article XML,
+                keyed by PMID (e.g. CACHE_DIR); None disables caching
         """
         self.api_key = api_key
         self.delay = delay
         self.logger = logging.getLogger(__name__)
         
+        # PubMed records are effectively immutable, so article XML can be
+        # reused across runs until the TTL expires
+        self.cache: Optional[diskcache.Cache] = diskcache.Cache(cache_dir) if cache_dir else None
+        
+        # Persistent session so connections to E-utilities are kept alive
+        # and reused; transient failures are retried honouring Retry-After
+        retry = Retry(
+            total=self.MAX_RETRIES,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=frozenset(['GET', 'POST']),
+            backoff_factor=0.5,
+            respect_retry_after_header=True
+        )
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=32, max_retries=retry)
+        self.session = requests.Session()
+        self.session.mount('https://', adapter)
+        
+        # Compiled XPath expressions reused for every parsed article
+        self._xpath_pmid = etree.XPath('.//PMID')
+        self._xpath_title = etree.XPath('.//ArticleTitle')
+        self._xpath_pub_date = etree.XPath('.//PubDate')
+        self._xpath_year = etree.XPath('Year')
+        self._xpath_month = etree.XPath('Month')
+        self._xpath_authors = etree.XPath('.//AuthorList/Author')
+        self._xpath_abstract = etree.XPath('.//AbstractText')
+        self._xpath_last_name = etree.XPath('LastName')
+        self._xpath_fore_name = etree.XPath('ForeName')
+        self._xpath_affiliation = etree.XPath('AffiliationInfo/Affiliation')
+        
+    def __enter__(self) -> 'PubMedClient':
+        return self
+        
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+        
+    def close(self) -> None:
+        """Close the underlying HTTP session and on-disk cache."""
+        self.session.close()
+        if self.cache is not None:
+            self.cache.close()
+        
     def search_papers(self, query: str, max_results: int = 100) -> List[str]:
         """
         Search for papers using PubMed query.
         
+        Use this when the raw PMIDs are needed; to retrieve paper details
+        for a query, search_and_fetch avoids round-tripping the ID list.
+        
         Args:
             query: PubMed search query
-            max_results: Maximum number of results to return
+            max_results: Maximum number of results to return (ESearch
+                returns at most 10,000)
             
         Returns:
             List of PubMed IDs
         """
-        params = {
+        result = self._esearch(query, retmax=max_results)
+        id_list: List[str] = result.get('idlist', [])
+        
+        self.logger.info(f"Found {len(id_list)} papers for query: {query}")
+        return id_list
+        
+    def search_and_fetch(self, query: str, max_results: int = 100) -> Tuple[int, Iterator[Dict[str, Any]]]:
+        """
+        Search PubMed and stream details for the matching papers.
+        
+        A single ESearch returns the PMIDs and also stores them on the
+        E-utilities history server. The returned iterator serves cached
+        papers locally and fetches the rest with EFetch, paging through the
+        stored search when a whole batch is uncached. Pages are checked
+        against the PMID list, so any PMIDs a page does not return are
+        posted by ID instead.
+        
+        Args:
+            query: PubMed search query
+            max_results: Maximum number of papers to fetch
+            
+        Returns:
+            Tuple of (number of papers to be fetched, iterator over paper details)
+        """
+        result = self._esearch(query, retmax=max_results, usehistory=True)
+        pmids: List[str] = result.get('idlist', [])
+        history = (result.get('webenv', ''), result.get('querykey', ''))
+        
+        self.logger.info(f"Found {len(pmids)} papers for query: {query}")
+        return len(pmids), self.fetch_papers_bulk(pmids, history=history)
+        
+    def _esearch(self, query: str, retmax: int, usehistory: bool = False) -> Dict[str, Any]:
+        """
+        Run an ESearch request and return its result section.
+        
+        Args:
+            query: PubMed search query
+            retmax: Maximum number of IDs to return (capped at 10,000)
+            usehistory: Store the results on the E-utilities history server
+            
+        Returns:
+            The 'esearchresult' dictionary from the response
+        """
+        params: Dict[str, Any] = {
             'db': 'pubmed',
             'term': query,
-            'retmax': max_results,
+            'retmax': min(retmax, self.MAX_SEARCH_RESULTS),
             'retmode': 'json',
             'sort': 'relevance'
         }
         
+        if usehistory:
+            params['usehistory'] = 'y'
+            
         if self.api_key:
             params['api_key'] = self.api_key
             
         try:
             self.logger.debug(f"Searching PubMed with query: {query}")
-            response = requests.get(self.SEARCH_URL, params=params, timeout=30)
+            response = self.session.get(self.SEARCH_URL, params=params, timeout=30)
             response.raise_for_status()
             
-            data = response.json()
-            id_list = data.get('esearchresult', {}).get('idlist', [])
-            
-            self.logger.info(f"Found {len(id_list)} papers for query: {query}")
+            result = cast(Dict[str, Any], orjson.loads(response.content).get('esearchresult', {}))
             time.sleep(self.delay)
             
-            return id_list
+            return result
             
         except requests.RequestException as e:
             self.logger.error(f"Error searching PubMed: {e}")
@@ -80,9 +230,333 @@ class PubMedClient:
         Returns:
             Dictionary containing paper details or None if error
         """
+        return next(self.fetch_papers_bulk([pmid]), None)
+        
+    def fetch_papers_bulk(self, pmids: List[str], batch_size: int = 200,
+                          history: Optional[Tuple[str, str]] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Fetch detailed information about many papers using batched EFetch calls.
+        
+        Papers are yielded as each batch is parsed, so callers can start
+        processing before the remaining batches have been downloaded.
+        PMIDs found in the on-disk cache are parsed without any HTTP request.
+        
+        Args:
+            pmids: List of PubMed IDs
+            batch_size: Number of PMIDs to request per EFetch call
+            history: Optional (WebEnv, query key) of a search whose results
+                are pmids, used to fetch batches with no cache hits by position
+            
+        Yields:
+            Dictionaries containing paper details
+        """
+        batches = [pmids[start:start + batch_size] for start in range(0, len(pmids), batch_size)]
+        
+        # A worker thread downloads the next batch while this one is parsed
+        responses: queue.Queue = queue.Queue(maxsize=2)
+        stop = threading.Event()
+        worker = threading.Thread(target=self._fetch_worker, args=(batches, responses, stop, history),
+                                  daemon=True)
+        worker.start()
+        
+        try:
+            for item in iter(responses.get, None):
+                if isinstance(item, Exception):
+                    raise item
+                    
+                batch, cached, content, by_position = item
+                fetched: Dict[str, Dict[str, Any]] = {}
+                
+                if content is not None:
+                    try:
+                        papers = self._iter_paper_xml(content, store=True)
+                        if not cached and not by_position:
+                            yield from papers
+                        else:
+                            fetched = {paper['pmid']: paper for paper in papers}
+                            
+                    except etree.XMLSyntaxError as e:
+                        self.logger.error(f"Error parsing paper details for PMIDs {batch[0]}..{batch[-1]}: {e}")
+                        
+                    # A history page is only trusted for the PMIDs it actually returned
+                    if by_position:
+                        fetched.update(self._fetch_missing([pmid for pmid in batch if pmid not in fetched]))
+                        
+                # Merge cached and freshly fetched papers back into request order
+                for pmid in batch:
+                    if pmid in cached:
+                        yield from self._iter_paper_xml(cached[pmid])
+                    elif pmid in fetched:
+                        yield fetched[pmid]
+                        
+        finally:
+            stop.set()
+            worker.join(timeout=self.WORKER_JOIN_TIMEOUT)
+            
+    def _fetch_worker(self, batches: List[List[str]], out_queue: queue.Queue, stop: threading.Event,
+                      history: Optional[Tuple[str, str]] = None) -> None:
+        """
+        Download EFetch batches and hand the raw responses to the consumer.
+        
+        Each queue item is (batch, cached article XML, response body or None,
+        whether the body was fetched by position from the history server).
+        An unexpected exception is put on the queue for the consumer to
+        re-raise, and a final None marks the end of the stream.
+        
+        Args:
+            batches: PMID batches to fetch
+            out_queue: Bounded queue read by fetch_papers_bulk
+            stop: Event set when the consumer stops reading
+            history: Optional (WebEnv, query key) matching the batched PMIDs
+        """
+        try:
+            retstart = 0
+            for batch in batches:
+                if stop.is_set():
+                    return
+                    
+                cached = self._cache_lookup(batch)
+                misses = [pmid for pmid in batch if pmid not in cached]
+                by_position = False
+                content = None
+                
+                if history and not cached:
+                    # Nothing cached: page through the stored search instead of sending IDs
+                    by_position = True
+                    content = self._get_history_page(*history, retstart, len(batch))
+                elif misses:
+                    content = self._post_efetch(misses, cached=len(cached))
+                    
+                retstart += len(batch)
+                if not self._put_until_stopped(out_queue, (batch, cached, content, by_position), stop):
+                    return
+                    
+        except Exception as e:
+            self._put_until_stopped(out_queue, e, stop)
+            
+        finally:
+            self._put_until_stopped(out_queue, None, stop)
+            
+    def _fetch_missing(self, pmids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch by ID the papers a history page did not return.
+        
+        Args:
+            pmids: PubMed IDs missing from the page
+            
+        Returns:
+            Dictionary mapping fetched PMIDs to their paper details
+        """
+        if not pmids:
+            return {}
+            
+        self.logger.warning(f"History page did not return {len(pmids)} PMIDs, fetching them by ID")
+        content = self._post_efetch(pmids)
+        if content is None:
+            return {}
+            
+        try:
+            return {paper['pmid']: paper for paper in self._iter_paper_xml(content, store=True)}
+        except etree.XMLSyntaxError as e:
+            self.logger.error(f"Error parsing paper details for PMIDs {pmids[0]}..{pmids[-1]}: {e}")
+            return {}
+            
+    def _post_efetch(self, pmids: List[str], cached: int = 0) -> Optional[bytes]:
+        """
+        Request a list of papers from EFetch by PMID.
+        
+        Args:
+            pmids: PubMed IDs to fetch
+            cached: Number of PMIDs in the batch served from the cache, for logging
+            
+        Returns:
+            Raw XML response body, or None if the request failed
+        """
+        params = self._build_fetch_params(pmids)
+        
+        try:
+            self.logger.debug(f"Fetching details for {len(pmids)} PMIDs ({cached} cached)")
+            # POST keeps long ID lists out of the URL
+            response = self.session.post(self.FETCH_URL, data=params, timeout=30)
+            response.raise_for_status()
+            return response.content
+            
+        except requests.RequestException as e:
+            self.logger.error(f"Error fetching paper details for PMIDs {pmids[0]}..{pmids[-1]}: {e}")
+            return None
+            
+        finally:
+            time.sleep(self.delay)
+            
+    def _get_history_page(self, webenv: str, query_key: str, retstart: int, retmax: int) -> Optional[bytes]:
+        """
+        Request a page of a stored search from EFetch by position.
+        
+        Args:
+            webenv: WebEnv of the stored search
+            query_key: Query key of the stored search
+            retstart: Index of the first result to fetch
+            retmax: Number of results to fetch
+            
+        Returns:
+            Raw XML response body, or None if the request failed
+        """
+        params = self._build_history_params(webenv, query_key, retstart, retmax)
+        
+        try:
+            self.logger.debug(f"Fetching results {retstart + 1}-{retstart + retmax} from the history server")
+            response = self.session.get(self.FETCH_URL, params=params, timeout=30)
+            response.raise_for_status()
+            return response.content
+            
+        except requests.RequestException as e:
+            self.logger.error(f"Error fetching results starting at {retstart}: {e}")
+            return None
+            
+        finally:
+            time.sleep(self.delay)
+            
+    @staticmethod
+    def _put_until_stopped(out_queue: queue.Queue, item: Any, stop: threading.Event) -> bool:
+        """
+        Put an item on a bounded queue, giving up once the consumer has stopped.
+        
+        Args:
+            out_queue: Queue to put the item on
+            item: Item to enqueue
+            stop: Event set when the consumer stops reading
+            
+        Returns:
+            True if the item was enqueued, False if the consumer stopped
+        """
+        while not stop.is_set():
+            try:
+                out_queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+                
+        return False
+        
+    def _cache_lookup(self, pmids: List[str]) -> Dict[str, bytes]:
+        """
+        Look up cached article XML for a list of PMIDs.
+        
+        Args:
+            pmids: List of PubMed IDs
+            
+        Returns:
+            Dictionary mapping cached PMIDs to their article XML
+        """
+        if self.cache is None:
+            return {}
+            
+        cached = {}
+        for pmid in pmids:
+            article_xml = self.cache.get(pmid)
+            if article_xml is not None:
+                cached[pmid] = article_xml
+                
+        return cached
+        
+    async def fetch_paper_details_async(self, pmids: List[str], batch_size: int = 200) -> List[Dict[str, Any]]:
+        """
+        Fetch detailed information about many papers concurrently.
+        
+        Batches are requested in parallel, capped at the NCBI rate limit
+        (10 requests/second with an API key, 3 without). Requires the
+        optional aiohttp dependency (``poetry install --extras async``).
+        
+        Args:
+            pmids: List of PubMed IDs
+            batch_size: Number of PMIDs to request per EFetch call
+            
+        Returns:
+            List of dictionaries containing paper details
+        """
+        try:
+            import aiohttp
+        except ImportError as e:
+            raise ImportError(
+                "fetch_paper_details_async requires aiohttp: poetry install --extras async"
+            ) from e
+            
+        max_concurrency = 10 if self.api_key else 3
+        semaphore = asyncio.Semaphore(max_concurrency)
+        rate_limiter = _RateLimiter(max_concurrency)
+        
+        batches = [pmids[start:start + batch_size] for start in range(0, len(pmids), batch_size)]
+        timeout = aiohttp.ClientTimeout(total=30)
+        
+        async with aiohttp.ClientSession(timeout=timeout) as session:
+            results = await asyncio.gather(
+                *(self._afetch(session, batch, semaphore, rate_limiter) for batch in batches)
+            )
+            
+        return [paper for batch_papers in results for paper in batch_papers]
+        
+    async def _afetch(self, session: 'aiohttp.ClientSession', pmids: List[str],
+                      semaphore: asyncio.Semaphore, rate_limiter: _RateLimiter) -> List[Dict[str, Any]]:
+        """
+        Fetch and parse one batch of papers, retrying when rate limited.
+        
+        Args:
+            session: Shared HTTP session
+            pmids: PubMed IDs in this batch
+            semaphore: Semaphore bounding concurrent requests
+            rate_limiter: Limiter enforcing the per-second request cap
+            
+        Returns:
+            List of dictionaries containing paper details
+        """
+        import aiohttp
+        
+        params = self._build_fetch_params(pmids)
+        
+        async with semaphore:
+            for attempt in range(self.MAX_RETRIES + 1):
+                await rate_limiter.acquire()
+                try:
+                    self.logger.debug(f"Fetching details for {len(pmids)} PMIDs")
+                    async with session.post(self.FETCH_URL, data=params) as response:
+                        if response.status != 429:
+                            response.raise_for_status()
+                            content = await response.read()
+                            break
+                        retry_after = response.headers.get('Retry-After', '1')
+                        
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    self.logger.error(f"Error fetching paper details for PMIDs {pmids[0]}..{pmids[-1]}: {e}")
+                    return []
+                    
+                delay = int(retry_after) if retry_after.isdigit() else 1
+                self.logger.warning(f"Rate limited by PubMed (attempt {attempt + 1}), retrying in {delay}s")
+                await asyncio.sleep(delay)
+            else:
+                self.logger.error(f"Giving up on PMIDs {pmids[0]}..{pmids[-1]} after {self.MAX_RETRIES} retries")
+                return []
+                
+        # Parse XML off the event loop
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(None, self._parse_articles, content)
+        except etree.XMLSyntaxError as e:
+            self.logger.error(f"Error parsing paper details for PMIDs {pmids[0]}..{pmids[-1]}: {e}")
+            return []
+            
+    def _build_fetch_params(self, pmids: List[str]) -> Dict[str, str]:
+        """
+        Build EFetch request parameters for a list of PMIDs.
+        
+        Args:
+            pmids: List of PubMed IDs
+            
+        Returns:
+            Dictionary of request parameters
+        """
         params = {
             'db': 'pubmed',
-            'id': pmid,
+            'id': ','.join(pmids),
             'retmode': 'xml',
             'rettype': 'abstract'
         }
@@ -90,35 +564,85 @@ class PubMedClient:
         if self.api_key:
             params['api_key'] = self.api_key
             
-        try:
-            self.logger.debug(f"Fetching details for PMID: {pmid}")
-            response = requests.get(self.FETCH_URL, params=params, timeout=30)
-            response.raise_for_status()
+        return params
+        
+    def _build_history_params(self, webenv: str, query_key: str, retstart: int, retmax: int) -> Dict[str, Any]:
+        """
+        Build EFetch request parameters for a page of a stored search.
+        
+        Args:
+            webenv: WebEnv of the stored search
+            query_key: Query key of the stored search
+            retstart: Index of the first result to fetch
+            retmax: Number of results to fetch
             
-            # Parse XML response
-            root = ET.fromstring(response.content)
+        Returns:
+            Dictionary of request parameters
+        """
+        params = {
+            'db': 'pubmed',
+            'WebEnv': webenv,
+            'query_key': query_key,
+            'retstart': retstart,
+            'retmax': retmax,
+            'retmode': 'xml',
+            'rettype': 'abstract'
+        }
+        
+        if self.api_key:
+            params['api_key'] = self.api_key
             
-            # Extract paper information
-            paper_info = self._parse_paper_xml(root)
+        return params
+        
+    def _parse_articles(self, content: bytes) -> List[Dict[str, Any]]:
+        """
+        Parse every PubmedArticle in an EFetch response into a list.
+        
+        Args:
+            content: Raw XML response body
             
-            time.sleep(self.delay)
-            return paper_info
+        Returns:
+            List of dictionaries with paper details
+        """
+        return list(self._iter_paper_xml(content))
+        
+    def _iter_paper_xml(self, content: bytes, store: bool = False) -> Iterator[Dict[str, Any]]:
+        """
+        Stream PubmedArticle elements out of an EFetch response.
+        
+        Each article is freed as soon as it has been parsed, so only one
+        article is held in memory at a time.
+        
+        Args:
+            content: Raw XML response body
+            store: Save each article's XML in the on-disk cache
             
-        except (requests.RequestException, ET.ParseError) as e:
-            self.logger.error(f"Error fetching paper details for PMID {pmid}: {e}")
-            return None
+        Yields:
+            Dictionaries with paper details
+        """
+        for _, pubmed_article in etree.iterparse(BytesIO(content), events=('end',), tag='PubmedArticle'):
+            paper_info = self._parse_paper_xml(pubmed_article)
+            
+            if store and self.cache is not None and paper_info['pmid']:
+                self.cache.set(paper_info['pmid'], etree.tostring(pubmed_article), expire=self.CACHE_TTL)
+                
+            yield paper_info
             
-    def _parse_paper_xml(self, root: ET.Element) -> Dict[str, Any]:
+            pubmed_article.clear()
+            while pubmed_article.getprevious() is not None:
+                del pubmed_article.getparent()[0]
+            
+    def _parse_paper_xml(self, pubmed_article: etree._Element) -> Dict[str, Any]:
         """
-        Parse PubMed XML response to extract paper details.
+        Parse a PubmedArticle element to extract paper details.
         
         Args:
-            root: XML root element
+            pubmed_article: PubmedArticle XML element
             
         Returns:
             Dictionary with paper details
         """
-        paper_info = {
+        paper_info: Dict[str, Any] = {
             'pmid': '',
             'title': '',
             'publication_date': '',
@@ -126,49 +650,42 @@ class PubMedClient:
             'corresponding_author_email': '',
             'abstract': ''
         }
-        
-        # Find the PubmedArticle element
-        pubmed_article = root.find('.//PubmedArticle')
-        if pubmed_article is None:
-            return paper_info
             
         # Extract PMID
-        pmid_elem = pubmed_article.find('.//PMID')
+        pmid_elem = self._first(self._xpath_pmid, pubmed_article)
         if pmid_elem is not None:
             paper_info['pmid'] = pmid_elem.text
             
         # Extract title
-        title_elem = pubmed_article.find('.//ArticleTitle')
+        title_elem = self._first(self._xpath_title, pubmed_article)
         if title_elem is not None:
             paper_info['title'] = title_elem.text or ''
             
         # Extract publication date
-        pub_date = pubmed_article.find('.//PubDate')
+        pub_date = self._first(self._xpath_pub_date, pubmed_article)
         if pub_date is not None:
-            year_elem = pub_date.find('Year')
-            month_elem = pub_date.find('Month')
+            year_elem = self._first(self._xpath_year, pub_date)
+            month_elem = self._first(self._xpath_month, pub_date)
             if year_elem is not None:
-                date_parts = [year_elem.text]
+                date_parts = [year_elem.text or '']
                 if month_elem is not None:
-                    date_parts.insert(0, month_elem.text)
+                    date_parts.insert(0, month_elem.text or '')
                 paper_info['publication_date'] = '-'.join(date_parts)
                 
         # Extract authors
-        author_list = pubmed_article.find('.//AuthorList')
-        if author_list is not None:
-            for author in author_list.findall('Author'):
-                author_info = self._parse_author(author)
-                if author_info:
-                    paper_info['authors'].append(author_info)
+        for author in cast(List[etree._Element], self._xpath_authors(pubmed_article)):
+            author_info = self._parse_author(author)
+            if author_info:
+                paper_info['authors'].append(author_info)
                     
         # Extract abstract
-        abstract_elem = pubmed_article.find('.//AbstractText')
+        abstract_elem = self._first(self._xpath_abstract, pubmed_article)
         if abstract_elem is not None:
             paper_info['abstract'] = abstract_elem.text or ''
             
         return paper_info
         
-    def _parse_author(self, author_elem: ET.Element) -> Optional[Dict[str, Any]]:
+    def _parse_author(self, author_elem: etree._Element) -> Optional[Dict[str, Any]]:
         """
         Parse author information from XML.
         
@@ -178,15 +695,15 @@ class PubMedClient:
         Returns:
             Dictionary with author details
         """
-        author_info = {
+        author_info: Dict[str, Any] = {
             'name': '',
             'affiliation': '',
             'email': ''
         }
         
         # Extract name
-        last_name_elem = author_elem.find('LastName')
-        first_name_elem = author_elem.find('ForeName')
+        last_name_elem = self._first(self._xpath_last_name, author_elem)
+        first_name_elem = self._first(self._xpath_fore_name, author_elem)
         
         if last_name_elem is not None and first_name_elem is not None:
             author_info['name'] = f"{first_name_elem.text} {last_name_elem.text}"
@@ -196,13 +713,29 @@ class PubMedClient:
             author_info['name'] = first_name_elem.text
             
         # Extract affiliation
-        affiliation_elem = author_elem.find('AffiliationInfo/Affiliation')
+        affiliation_elem = self._first(self._xpath_affiliation, author_elem)
         if affiliation_elem is not None:
-            author_info['affiliation'] = affiliation_elem.text or ''
+            affiliation_text = affiliation_elem.text or ''
+            author_info['affiliation'] = affiliation_text
+            
+            # Extract email (if available), dropping sentence-ending dots
+            email_match = self._EMAIL_RE.search(affiliation_text)
+            if email_match:
+                author_info['email'] = email_match.group(0).rstrip('.')
             
-        # Extract email (if available)
-        email_elem = author_elem.find('AffiliationInfo/Affiliation')
-        if email_elem is not None and '@' in (email_elem.text or ''):
-            author_info['email'] = email_elem.text
+        return author_info if author_info['name'] else None 
+        
+    @staticmethod
+    def _first(xpath: etree.XPath, element: etree._Element) -> Optional[etree._Element]:
+        """
+        Return the first element matched by a compiled XPath, if any.
+        
+        Args:
+            xpath: Compiled XPath expression
+            element: Element to evaluate the expression against
             
-        return author_info if author_info['name'] else None 
\ No newline at end of file
+        Returns:
+            First matching element or None
+        """
+        matches = cast(List[etree._Element], xpath(element))
+        return matches[0] if matches else None
\ No newline at end of file
@@ -0,0 +1,124 @@
+"""
+Tests for the CSV exporter module.
+"""
+
+import csv
+import pytest
+from pubmed_fetcher.csv_exporter import CSVExporter
+
+
+class TestCSVExporter:
+    """Test cases for CSVExporter class."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.exporter = CSVExporter()
+        self.row = {
+            'pmid': '12345',
+            'title': 'Test Paper',
+            'publication_date': 'Jan-2023',
+            'non_academic_authors': 'John Smith',
+            'company_affiliations': 'Pfizer Inc.',
+            'corresponding_author_email': 'john.smith@pfizer.com'
+        }
+    
+    def read_csv(self, path):
+        """Read a written CSV file back as a list of rows."""
+        with open(path, newline='', encoding='utf-8') as csvfile:
+            return list(csv.reader(csvfile))
+    
+    def test_truncate(self):
+        """Test that only values over the limit are cut with an ellipsis."""
+        assert CSVExporter._truncate('a' * 60, 50) == 'a' * 50 + '...'
+        assert CSVExporter._truncate('a' * 50, 50) == 'a' * 50
+        assert CSVExporter._truncate('a' * 60, None) == 'a' * 60
+    
+    def test_export_to_console_pads_columns(self, capsys):
+        """Test that console rows are truncated and aligned under the header."""
+        long_row = dict(self.row, pmid='1', title='T' * 80)
+        
+        self.exporter.export_to_console([self.row, long_row])
+        lines = capsys.readouterr().out.splitlines()
+        
+        assert lines[1] == 'Found 2 papers with pharmaceutical/biotech company affiliations:'
+        assert lines[2] == lines[6] == '=' * 80
+        header, first, second = lines[3:6]
+        assert header.startswith('PubmedID  Title')
+        assert second.startswith('1'.ljust(len('PubmedID')) + '  ' + 'T' * 50 + '...  Jan-2023')
+        # Every column starts at the same offset as its header
+        for name, value in [('Title', 'Test Paper'), ('Publication Date', 'Jan-2023'),
+                            ('Corresponding Author Email', 'john.smith@pfizer.com')]:
+            assert first.index(value) == header.index(name)
+    
+    def test_export_to_console_header_only_widths(self, capsys):
+        """Test that short values are padded to the header width."""
+        short_row = dict(self.row, non_academic_authors='A', company_affiliations='B')
+        
+        self.exporter.export_to_console([short_row])
+        header, row = capsys.readouterr().out.splitlines()[3:5]
+        
+        assert row.index('B') == header.index('Company Affiliation(s)')
+        assert row.index('john.smith') == header.index('Corresponding Author Email')
+    
+    def test_export_to_console_empty(self, capsys):
+        """Test the message printed when there is nothing to show."""
+        self.exporter.export_to_console([])
+        
+        assert capsys.readouterr().out == 'No papers found matching the criteria.\n'
+    
+    def test_export_to_csv(self, tmp_path):
+        """Test that rows are written in column order after the header."""
+        path = tmp_path / 'results.csv'
+        
+        assert self.exporter.export_to_csv([self.row], str(path))
+        assert self.read_csv(path) == [
+            CSVExporter.FIELDNAMES,
+            ['12345', 'Test Paper', 'Jan-2023', 'John Smith', 'Pfizer Inc.', 'john.smith@pfizer.com']
+        ]
+    
+    def test_export_stream_counts_rows(self, tmp_path):
+        """Test that export_stream skips invalid rows and reports the count."""
+        path = tmp_path / 'results.csv'
+        rows = [dict(self.row, pmid=str(pmid)) for pmid in range(3)] + [{'pmid': '999'}]
+        
+        written = self.exporter.export_stream(iter(rows), str(path))
+        
+        assert written == 3
+        content = self.read_csv(path)
+        assert content[0] == CSVExporter.FIELDNAMES
+        assert [row[0] for row in content[1:]] == ['0', '1', '2']
+    
+    def test_export_stream_empty_creates_no_file(self, tmp_path):
+        """Test that an empty stream returns 0 without creating the file."""
+        path = tmp_path / 'results.csv'
+        
+        assert self.exporter.export_stream(iter([]), str(path)) == 0
+        assert not path.exists()
+    
+    def test_export_stream_write_error(self, tmp_path):
+        """Test that an unwritable path is reported as None."""
+        path = tmp_path / 'missing' / 'results.csv'
+        
+        assert self.exporter.export_stream([self.row], str(path)) is None
+    
+    def test_export_stream_propagates_upstream_errors(self, tmp_path):
+        """Test that errors raised while producing rows are not swallowed."""
+        def rows():
+            yield self.row
+            raise ValueError('analysis failed')
+        
+        with pytest.raises(ValueError, match='analysis failed'):
+            self.exporter.export_stream(rows(), str(tmp_path / 'results.csv'))
+            
+    def test_export_stream_propagates_upstream_os_errors(self, tmp_path):
+        """Test that an OSError from the row source is not reported as a write error."""
+        error = ConnectionError('connection reset')
+        
+        def rows():
+            yield self.row
+            raise error
+            
+        with pytest.raises(ConnectionError) as excinfo:
+            self.exporter.export_stream(rows(), str(tmp_path / 'results.csv'))
+            
+        assert excinfo.value is error
\ No newline at end of file
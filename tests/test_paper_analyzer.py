@@ -3,6 +3,8 @@ Tests for the paper analyzer module.
 """
 
 import pytest
+from concurrent.futures import ProcessPoolExecutor
+from unittest.mock import patch
 from pubmed_fetcher.paper_analyzer import PaperAnalyzer
 
 
@@ -81,4 +83,108 @@ class TestPaperAnalyzer:
         assert result['pmid'] == '12346'
         assert result['title'] == 'Test Paper 2'
         assert result['non_academic_authors'] == ''
-        assert result['company_affiliations'] == '' 
\ No newline at end of file
+        assert result['company_affiliations'] == ''
+        
+    def test_analyze_paper_deduplicates_in_order(self):
+        """Test that repeated authors and companies are deduplicated in first-seen order."""
+        paper_data = {
+            'pmid': '12347',
+            'title': 'Test Paper 3',
+            'authors': [
+                {'name': 'John Smith', 'affiliation': 'Pfizer Inc., New York, NY'},
+                {'name': 'Ann Lee', 'affiliation': 'Amgen Inc., Thousand Oaks, CA'},
+                {'name': 'John Smith', 'affiliation': 'Pfizer Inc., New York, NY'}
+            ]
+        }
+        
+        result = self.analyzer.analyze_paper(paper_data)
+        companies = result['company_affiliations'].split('; ')
+        
+        assert result['non_academic_authors'] == 'John Smith; Ann Lee'
+        assert len(companies) == len(set(companies))
+        assert companies[0].startswith('pfizer')
+        
+    def test_analyze_paper_caches_repeated_affiliations(self):
+        """Test that a shared affiliation is classified only once."""
+        paper_data = {
+            'pmid': '12348',
+            'title': 'Test Paper 4',
+            'authors': [
+                {'name': 'John Smith', 'affiliation': 'Novartis Pharmaceuticals'},
+                {'name': 'Ann Lee', 'affiliation': 'Novartis Pharmaceuticals'}
+            ]
+        }
+        
+        result = self.analyzer.analyze_paper(paper_data)
+        
+        assert result['non_academic_authors'] == 'John Smith; Ann Lee'
+        assert self.analyzer._classify.cache_info().hits == 1
+        
+    def test_analyze_iter_filters_papers_without_company_affiliation(self):
+        """Test that lazy analysis only yields papers with company affiliations."""
+        papers = [
+            {
+                'pmid': '1',
+                'title': 'Industry Paper',
+                'authors': [{'name': 'John Smith', 'affiliation': 'Pfizer Inc., New York, NY'}]
+            },
+            {
+                'pmid': '2',
+                'title': 'Academic Paper',
+                'authors': [{'name': 'Jane Doe', 'affiliation': 'Harvard University'}]
+            }
+        ]
+        
+        results = list(self.analyzer.analyze_iter(papers))
+        
+        assert [result['pmid'] for result in results] == ['1']
+        
+    def test_analyze_iter_with_process_pool(self):
+        """Test that analysis across worker processes preserves input order."""
+        papers = [
+            {
+                'pmid': str(i),
+                'title': f'Paper {i}',
+                'authors': [{'name': 'John Smith', 'affiliation': 'Pfizer Inc., New York, NY'}]
+            }
+            for i in range(10)
+        ]
+        
+        results = list(self.analyzer.analyze_iter(papers, workers=2, chunksize=3))
+        
+        assert [result['pmid'] for result in results] == [str(i) for i in range(10)]
+        
+    def test_analyze_iter_with_process_pool_is_lazy(self):
+        """Test that parallel analysis only pulls a bounded number of papers ahead."""
+        pulled = []
+        
+        def papers():
+            for i in range(1000):
+                pulled.append(i)
+                yield {
+                    'pmid': str(i),
+                    'title': f'Paper {i}',
+                    'authors': [{'name': 'John Smith', 'affiliation': 'Pfizer Inc., New York, NY'}]
+                }
+                
+        results = self.analyzer.analyze_iter(papers(), workers=2, chunksize=10)
+        first = next(results)
+        results.close()
+        
+        assert first['pmid'] == '0'
+        # At most 2 x workers chunks are submitted before the first result
+        assert len(pulled) <= 2 * 2 * 10
+        
+    def test_analyze_iter_spawns_worker_processes(self):
+        """Test that the pool does not fork the threaded parent process."""
+        papers = [
+            {'pmid': str(i), 'title': f'Paper {i}',
+             'authors': [{'name': 'John Smith', 'affiliation': 'Pfizer Inc., New York, NY'}]}
+            for i in range(4)
+        ]
+        
+        with patch('pubmed_fetcher.paper_analyzer.ProcessPoolExecutor', wraps=ProcessPoolExecutor) as pool:
+            results = list(self.analyzer.analyze_iter(papers, workers=2, chunksize=2))
+            
+        assert [result['pmid'] for result in results] == ['0', '1', '2', '3']
+        assert pool.call_args.kwargs['mp_context'].get_start_method() == 'spawn'
\ No newline at end of file
@@ -0,0 +1,383 @@
+"""
+Tests for the PubMed client module.
+"""
+
+import asyncio
+import json
+import threading
+import time
+import pytest
+import requests
+from unittest.mock import Mock
+from pubmed_fetcher.pubmed_client import PubMedClient, _RateLimiter
+
+
+SAMPLE_XML = b"""<?xml version="1.0" ?>
+<PubmedArticleSet>
+  <PubmedArticle>
+    <MedlineCitation>
+      <PMID>12345</PMID>
+      <Article>
+        <Journal>
+          <JournalIssue>
+            <PubDate><Year>2023</Year><Month>Jan</Month></PubDate>
+          </JournalIssue>
+        </Journal>
+        <ArticleTitle>Test Paper</ArticleTitle>
+        <AuthorList>
+          <Author>
+            <LastName>Smith</LastName>
+            <ForeName>John</ForeName>
+            <AffiliationInfo>
+              <Affiliation>Pfizer Inc., New York, NY. Electronic address: john.smith@pfizer.com.</Affiliation>
+            </AffiliationInfo>
+          </Author>
+          <Author>
+            <LastName>Doe</LastName>
+            <ForeName>Jane</ForeName>
+            <AffiliationInfo>
+              <Affiliation>Harvard University, Boston, MA</Affiliation>
+            </AffiliationInfo>
+          </Author>
+        </AuthorList>
+      </Article>
+    </MedlineCitation>
+  </PubmedArticle>
+  <PubmedArticle>
+    <MedlineCitation>
+      <PMID>12346</PMID>
+      <Article>
+        <ArticleTitle>Test Paper 2</ArticleTitle>
+      </Article>
+    </MedlineCitation>
+  </PubmedArticle>
+</PubmedArticleSet>
+"""
+
+
+def build_efetch_xml(pmids):
+    """Build a minimal EFetch response containing one article per PMID."""
+    articles = ''.join(
+        f"<PubmedArticle><MedlineCitation><PMID>{pmid}</PMID>"
+        f"<Article><ArticleTitle>Paper {pmid}</ArticleTitle></Article>"
+        f"</MedlineCitation></PubmedArticle>"
+        for pmid in pmids
+    )
+    return f"<PubmedArticleSet>{articles}</PubmedArticleSet>".encode()
+
+
+def fake_efetch(url, data, timeout):
+    """Stand-in for session.post that answers with the requested articles."""
+    return Mock(content=build_efetch_xml(data['id'].split(',')))
+
+
+def fake_esearch_and_history(pmids):
+    """Stand-in for session.get serving one stored search and its EFetch pages."""
+    def get(url, params, timeout):
+        if url == PubMedClient.SEARCH_URL:
+            result = {'esearchresult': {'count': str(len(pmids)), 'idlist': pmids,
+                                        'webenv': 'WEBENV', 'querykey': '1'}}
+            return Mock(content=json.dumps(result).encode())
+        start = params['retstart']
+        return Mock(content=build_efetch_xml(pmids[start:start + params['retmax']]))
+    return get
+
+
+class FakeAsyncResponse:
+    """Minimal aiohttp response for a canned status and body."""
+    
+    def __init__(self, status, body=b'', headers=None):
+        self.status = status
+        self.body = body
+        self.headers = headers or {}
+        
+    async def __aenter__(self):
+        return self
+        
+    async def __aexit__(self, *exc_info):
+        return False
+        
+    def raise_for_status(self):
+        pass
+        
+    async def read(self):
+        return self.body
+
+
+class FakeAsyncSession:
+    """Stand-in for aiohttp.ClientSession replaying a list of responses."""
+    
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.calls = 0
+        
+    def post(self, url, data):
+        self.calls += 1
+        return self.responses.pop(0)
+
+
+class TestPubMedClient:
+    """Test cases for PubMedClient class."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.client = PubMedClient(delay=0)
+        
+    def teardown_method(self):
+        """Release client resources."""
+        self.client.close()
+        
+    def test_parse_articles_batch(self):
+        """Test that every article in a batched response is parsed."""
+        papers = self.client._parse_articles(SAMPLE_XML)
+        
+        assert [paper['pmid'] for paper in papers] == ['12345', '12346']
+        assert papers[0]['title'] == 'Test Paper'
+        assert papers[0]['publication_date'] == 'Jan-2023'
+        assert [author['name'] for author in papers[0]['authors']] == ['John Smith', 'Jane Doe']
+        
+    def test_parse_author_extracts_email(self):
+        """Test that only the email address is taken from the affiliation."""
+        papers = self.client._parse_articles(SAMPLE_XML)
+        authors = papers[0]['authors']
+        
+        assert authors[0]['email'] == 'john.smith@pfizer.com'
+        assert authors[0]['affiliation'].startswith('Pfizer Inc.')
+        assert authors[1]['email'] == ''
+        
+    def test_cache_disabled_by_default(self):
+        """Test that a bare client does not create an on-disk cache."""
+        assert self.client.cache is None
+        
+    def test_cache_hits_skip_http(self, tmp_path):
+        """Test that cached PMIDs are served without another EFetch request."""
+        client = PubMedClient(delay=0, cache_dir=str(tmp_path))
+        client.session.post = Mock(return_value=Mock(content=SAMPLE_XML))
+        
+        try:
+            first = [paper['pmid'] for paper in client.fetch_papers_bulk(['12345', '12346'])]
+            second = [paper['pmid'] for paper in client.fetch_papers_bulk(['12345', '12346'])]
+        finally:
+            client.close()
+            
+        assert first == second == ['12345', '12346']
+        assert client.session.post.call_count == 1
+        
+    def test_fetch_bulk_yields_every_batch(self):
+        """Test that the worker thread fetches each batch in order."""
+        self.client.session.post = Mock(side_effect=fake_efetch)
+        pmids = [str(pmid) for pmid in range(1, 8)]
+        
+        papers = list(self.client.fetch_papers_bulk(pmids, batch_size=3))
+        
+        assert [paper['pmid'] for paper in papers] == pmids
+        assert self.client.session.post.call_count == 3
+        
+    def test_fetch_bulk_early_exit_stops_worker(self):
+        """Test that abandoning the iterator stops the worker thread."""
+        self.client.session.post = Mock(side_effect=fake_efetch)
+        threads_before = threading.active_count()
+        
+        papers = self.client.fetch_papers_bulk([str(pmid) for pmid in range(50)], batch_size=1)
+        assert next(papers)['pmid'] == '0'
+        papers.close()
+        
+        assert threading.active_count() == threads_before
+        # One batch consumed, at most two queued and one blocked on the put
+        assert self.client.session.post.call_count <= 4
+        
+    def test_fetch_bulk_early_exit_does_not_wait_for_request(self):
+        """Test that shutdown does not block on a request still in flight."""
+        release = threading.Event()
+        
+        def slow_efetch(url, data, timeout):
+            if data['id'] != '0':
+                release.wait(10)
+            return fake_efetch(url, data, timeout)
+            
+        self.client.session.post = Mock(side_effect=slow_efetch)
+        threads_before = threading.active_count()
+        papers = self.client.fetch_papers_bulk(['0', '1'], batch_size=1)
+        
+        try:
+            assert next(papers)['pmid'] == '0'
+            started = time.monotonic()
+            papers.close()
+            assert time.monotonic() - started < PubMedClient.WORKER_JOIN_TIMEOUT + 1
+        finally:
+            release.set()
+            
+        # The released worker sees the stop event and exits without another request
+        deadline = time.monotonic() + 5
+        while threading.active_count() > threads_before and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert threading.active_count() == threads_before
+        assert self.client.session.post.call_count == 2
+            
+    def test_fetch_paper_details_returns_first_paper(self):
+        """Test that a single-paper fetch does not leave the worker running."""
+        self.client.session.post = Mock(side_effect=fake_efetch)
+        threads_before = threading.active_count()
+        
+        paper = self.client.fetch_paper_details('42')
+        
+        assert paper['title'] == 'Paper 42'
+        assert threading.active_count() == threads_before
+        
+    def test_fetch_bulk_reraises_worker_errors(self):
+        """Test that unexpected worker exceptions surface in the caller."""
+        self.client.session.post = Mock(side_effect=ValueError('bad response'))
+        
+        with pytest.raises(ValueError, match='bad response'):
+            list(self.client.fetch_papers_bulk(['1', '2']))
+            
+    def test_fetch_bulk_request_errors_skip_batch(self):
+        """Test that a failed EFetch request drops only its own batch."""
+        responses = [requests.ConnectionError('timed out'), None]
+        
+        def flaky_efetch(url, data, timeout):
+            error = responses.pop(0)
+            if error:
+                raise error
+            return fake_efetch(url, data, timeout)
+            
+        self.client.session.post = Mock(side_effect=flaky_efetch)
+        
+        papers = list(self.client.fetch_papers_bulk(['1', '2', '3', '4'], batch_size=2))
+        
+        assert [paper['pmid'] for paper in papers] == ['3', '4']
+        
+    def test_cache_merge_keeps_request_order(self, tmp_path):
+        """Test that cached and fetched papers are merged in request order."""
+        client = PubMedClient(delay=0, cache_dir=str(tmp_path))
+        client.session.post = Mock(side_effect=fake_efetch)
+        
+        try:
+            list(client.fetch_papers_bulk(['1', '2', '3']))
+            client.cache.delete('2')
+            papers = list(client.fetch_papers_bulk(['1', '2', '3']))
+        finally:
+            client.close()
+            
+        assert [paper['pmid'] for paper in papers] == ['1', '2', '3']
+        assert client.session.post.call_args.kwargs['data']['id'] == '2'
+        
+    def test_search_and_fetch_serves_cache_hits(self, tmp_path):
+        """Test that search_and_fetch only requests papers missing from the cache."""
+        pmids = [str(pmid) for pmid in range(1, 6)]
+        client = PubMedClient(delay=0, cache_dir=str(tmp_path))
+        client.session.get = Mock(side_effect=fake_esearch_and_history(pmids))
+        client.session.post = Mock(side_effect=fake_efetch)
+        
+        try:
+            count, papers = client.search_and_fetch('cancer', max_results=5)
+            first = [paper['pmid'] for paper in papers]
+            history_pages = client.session.get.call_count - 1
+            
+            client.cache.delete('3')
+            count, papers = client.search_and_fetch('cancer', max_results=5)
+            second = [paper['pmid'] for paper in papers]
+        finally:
+            client.close()
+            
+        assert count == 5
+        assert first == second == pmids
+        # Uncached batches page through the stored search; later only the miss is posted
+        assert history_pages == 1
+        assert client.session.get.call_count == 3
+        assert client.session.post.call_count == 1
+        assert client.session.post.call_args.kwargs['data']['id'] == '3'
+        
+    def test_search_and_fetch_pages_through_history(self):
+        """Test that uncached batches page through the stored search by position."""
+        pmids = [str(pmid) for pmid in range(1, 451)]
+        self.client.session.get = Mock(side_effect=fake_esearch_and_history(pmids))
+        
+        count, papers = self.client.search_and_fetch('cancer', max_results=450)
+        fetched = [paper['pmid'] for paper in papers]
+        
+        search_call, *page_calls = self.client.session.get.call_args_list
+        assert search_call.kwargs['params']['usehistory'] == 'y'
+        assert search_call.kwargs['params']['retmax'] == 450
+        assert [(call.kwargs['params']['retstart'], call.kwargs['params']['retmax'])
+                for call in page_calls] == [(0, 200), (200, 200), (400, 50)]
+        assert all(call.kwargs['params']['WebEnv'] == 'WEBENV' for call in page_calls)
+        assert count == 450
+        assert fetched == pmids
+        
+    def test_search_and_fetch_checks_history_order(self):
+        """Test that a history page out of step with the ID list falls back to POST."""
+        pmids = [str(pmid) for pmid in range(1, 6)]
+        search = fake_esearch_and_history(pmids)
+        
+        def get(url, params, timeout):
+            if url == PubMedClient.SEARCH_URL:
+                return search(url, params, timeout)
+            # Reordered page with one PMID swapped for a result outside the batch
+            return Mock(content=build_efetch_xml(['5', '4', '99', '2', '1']))
+            
+        self.client.session.get = Mock(side_effect=get)
+        self.client.session.post = Mock(side_effect=fake_efetch)
+        
+        count, papers = self.client.search_and_fetch('cancer', max_results=5)
+        
+        assert [paper['pmid'] for paper in papers] == pmids
+        assert self.client.session.post.call_count == 1
+        assert self.client.session.post.call_args.kwargs['data']['id'] == '3'
+
+
+class TestAsyncFetch:
+    """Test cases for the optional aiohttp fetch path."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        pytest.importorskip('aiohttp')
+        self.client = PubMedClient(delay=0)
+        
+    def teardown_method(self):
+        """Release client resources."""
+        self.client.close()
+        
+    def afetch(self, session, pmids):
+        """Run _afetch for one batch with a permissive rate limit."""
+        async def run():
+            return await self.client._afetch(session, pmids, asyncio.Semaphore(1), _RateLimiter(100))
+        return asyncio.run(run())
+        
+    def test_afetch_retries_after_rate_limit(self):
+        """Test that a 429 response is retried and the retry is parsed."""
+        session = FakeAsyncSession([
+            FakeAsyncResponse(429, headers={'Retry-After': '0'}),
+            FakeAsyncResponse(200, build_efetch_xml(['1', '2']))
+        ])
+        
+        papers = self.afetch(session, ['1', '2'])
+        
+        assert [paper['pmid'] for paper in papers] == ['1', '2']
+        assert session.calls == 2
+        
+    def test_afetch_gives_up_after_max_retries(self):
+        """Test that a batch is dropped once every retry is rate limited."""
+        self.client.MAX_RETRIES = 2
+        session = FakeAsyncSession(
+            [FakeAsyncResponse(429, headers={'Retry-After': '0'}) for _ in range(3)]
+        )
+        
+        assert self.afetch(session, ['1']) == []
+        assert session.calls == 3
+        
+    def test_rate_limiter_spaces_calls(self):
+        """Test that the limiter allows at most max_calls per period."""
+        async def run():
+            limiter = _RateLimiter(2, period=0.2)
+            times = []
+            for _ in range(5):
+                await limiter.acquire()
+                times.append(time.monotonic())
+            return times
+            
+        times = asyncio.run(run())
+        
+        assert times[1] - times[0] < 0.1
+        assert times[2] - times[0] >= 0.2
+        assert times[4] - times[2] >= 0.2
\ No newline at end of file